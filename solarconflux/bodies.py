@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
+import functools
 from typing import Dict, Iterable, List, Mapping, MutableMapping, Union
 
 BodyInfo = Dict[str, Union[str, int]]
@@ -67,9 +67,14 @@ _BODY_INFO: Dict[str, BodyInfo] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
 def get_infos() -> Dict[str, BodyInfo]:
-    """Return supported bodies and their Horizons identifiers/date ranges."""
-    return deepcopy(_BODY_INFO)
+    """Return supported bodies and their Horizons identifiers/date ranges.
+
+    The result is memoized and shared between callers; treat it as
+    read-only.
+    """
+    return {body: dict(info) for body, info in _BODY_INFO.items()}
 
 
 def supported_body_names() -> List[str]:
@@ -51,8 +51,10 @@ def save_match(
     with csv_path.open(mode="w", newline="") as handle:
         writer = csv.DictWriter(handle, fieldnames=CSV_COLUMNS)
         writer.writeheader()
-        for event_id, (start, end, geometry, bodies, latitude_span_deg) in enumerate(rows, start=1):
-            writer.writerow(_csv_row(event_id, start, end, geometry, bodies, latitude_span_deg, parameters))
+        writer.writerows(
+            _csv_row(event_id, start, end, geometry, bodies, latitude_span_deg, parameters)
+            for event_id, (start, end, geometry, bodies, latitude_span_deg) in enumerate(rows, start=1)
+        )
 
     return csv_path
 
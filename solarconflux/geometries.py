@@ -13,7 +13,9 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from .angles import angular_separation_rad, target_separation_rad
+import numpy as np
+
+from .angles import TAU, target_separation_rad
 from .events import MatchEntry, format_timestamp
 from .validation import (
     normalize_geometry_choices,
@@ -81,8 +83,54 @@ class Geometry:
         self.solar_rotation_rate = 2.0 * math.pi / (float(solar_rotation_period) * 24.0 * 3600.0)
 
         self._validate_trajectories()
-        self.states = self.calculate_states()
-        self.angles, self.latitudes = self.calculate_angles()
+        self._names = tuple(self.trajectories)
+        self._name_to_index = {name: index for index, name in enumerate(self._names)}
+        self.calculate_angles()
+        # Frame transforms already happened while stacking, so the per-step
+        # dates are fixed here once and indexed directly in check_geometry.
+        self.dates = np.asarray(self._times_by_body[0])
+        self._states: Optional[List[List[BodyState]]] = None
+        self._angles: Optional[List[List[float]]] = None
+        self._latitudes: Optional[List[List[Optional[float]]]] = None
+        self._phi0_cache: Dict[float, np.ndarray] = {}
+        self._pair_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+
+    @property
+    def states(self) -> List[List[BodyState]]:
+        """Normalized body states per time step, built on first access.
+
+        The geometry checks run entirely on the stacked float64 arrays, so
+        the per-point state objects are only materialized for callers that
+        ask for them.
+        """
+        if self._states is None:
+            self._states = self.calculate_states()
+        return self._states
+
+    @property
+    def angles(self) -> List[List[float]]:
+        """Per-step longitudes in radians, indexed ``[step][body]``.
+
+        A list view of ``self.lon`` kept for backward compatibility, with
+        longitudes normalized to [0, 2 pi); built on first access.
+        """
+        if self._angles is None:
+            self._angles = self.lon.T.tolist()
+        return self._angles
+
+    @property
+    def latitudes(self) -> List[List[Optional[float]]]:
+        """Per-step latitudes in radians, indexed ``[step][body]``.
+
+        A list view of ``self.lat`` kept for backward compatibility, with
+        missing latitudes reported as ``None``; built on first access.
+        """
+        if self._latitudes is None:
+            self._latitudes = [
+                [None if math.isnan(value) else value for value in step_values]
+                for step_values in self.lat.T.tolist()
+            ]
+        return self._latitudes
 
     def _validate_trajectories(self) -> None:
         if not self.trajectories:
@@ -104,22 +152,90 @@ class Geometry:
 
     def calculate_states(self) -> List[List[BodyState]]:
         """Return normalized body states for each time step."""
-        num_steps = len(next(iter(self.trajectories.values())))
+        names = self._names
+        num_steps = self.lon.shape[1]
         states: List[List[BodyState]] = []
 
         for step in range(num_steps):
             step_states = []
-            for name, trajectory in self.trajectories.items():
-                step_states.append(self._extract_state(name, trajectory[step]))
+            for index, name in enumerate(names):
+                lat_rad = float(self.lat[index, step])
+                step_states.append(
+                    BodyState(
+                        name=name,
+                        time=self._times_by_body[index][step],
+                        lon_rad=float(self.lon[index, step]),
+                        lat_rad=None if math.isnan(lat_rad) else lat_rad,
+                        radius_km=float(self.r[index, step]),
+                    )
+                )
             states.append(step_states)
 
         return states
 
-    def calculate_angles(self) -> Tuple[List[List[float]], List[List[float]]]:
-        """Return longitude and latitude arrays in radians."""
-        angles = [[state.lon_rad for state in step_states] for step_states in self.states]
-        latitudes = [[state.lat_rad for state in step_states] for step_states in self.states]
-        return angles, latitudes
+    def calculate_angles(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Stack all trajectories into contiguous float64 arrays.
+
+        Sets ``self.lon``, ``self.lat``, and ``self.r`` with shape
+        ``(n_bodies, n_steps)``, indexed in trajectory insertion order.
+        Longitudes are normalized to [0, 2 pi); missing latitudes are stored
+        as NaN. Returns the longitude and latitude arrays.
+        """
+        times_by_body: List[Sequence[object]] = []
+        lons: List[np.ndarray] = []
+        lats: List[np.ndarray] = []
+        radii: List[np.ndarray] = []
+
+        for name, trajectory in self.trajectories.items():
+            times, lon_rad, lat_rad, radius_km = self._extract_body_arrays(name, trajectory)
+            times_by_body.append(times)
+            lons.append(lon_rad)
+            lats.append(lat_rad)
+            radii.append(radius_km)
+
+        self._times_by_body = times_by_body
+        self.lon = np.mod(np.stack(lons), TAU)
+        self.lat = np.stack(lats)
+        self.r = np.stack(radii)
+        return self.lon, self.lat
+
+    def _extract_body_arrays(
+        self, name: str, trajectory: Sequence[object]
+    ) -> Tuple[Sequence[object], np.ndarray, np.ndarray, np.ndarray]:
+        """Extract time, longitude, latitude, and radius arrays for one body.
+
+        Vector coordinates such as a SkyCoord covering all time steps are
+        converted with one attribute access per quantity instead of one per
+        step; anything else falls back to per-point extraction.
+        """
+        if hasattr(trajectory, "spherical") and not isinstance(trajectory, TrajectoryPoint):
+            transformed = trajectory
+            if self.frame is not None and hasattr(trajectory, "transform_to"):
+                transformed = trajectory.transform_to(self.frame)
+            spherical = transformed.spherical
+            lon_rad = _angles_to_rad(spherical.lon)
+            lat = getattr(spherical, "lat", None)
+            lat_rad = np.full(lon_rad.shape, math.nan) if lat is None else _angles_to_rad(lat)
+            radius_km = _distances_to_km(spherical.distance)
+            times = np.atleast_1d(_coordinate_time(transformed))
+            return times, lon_rad, lat_rad, radius_km
+
+        times_list: List[object] = []
+        lon_list: List[float] = []
+        lat_list: List[float] = []
+        radius_list: List[float] = []
+        for point in trajectory:
+            state = self._extract_state(name, point)
+            times_list.append(state.time)
+            lon_list.append(state.lon_rad)
+            lat_list.append(math.nan if state.lat_rad is None else state.lat_rad)
+            radius_list.append(state.radius_km)
+        return (
+            times_list,
+            np.asarray(lon_list, dtype=float),
+            np.asarray(lat_list, dtype=float),
+            np.asarray(radius_list, dtype=float),
+        )
 
     def parker_spiral_function(self, r_km: float, lon_rad: float, u_sw_mps: float) -> float:
         """Estimate Parker source-surface footpoint longitude.
@@ -159,133 +275,230 @@ class Geometry:
         if normalized_mode in {"parker", "coneparker"}:
             validate_solar_wind_speed_mps(u_sw)
 
-        active_groups: Dict[Tuple[str, ...], Tuple[object, object, Optional[float]]] = {}
+        names = self._names
+        num_steps = self.lon.shape[1]
+        active_groups: Dict[int, Tuple[object, object, Optional[float]]] = {}
         matching_entries: List[MatchEntry] = []
-        for step_states in self.states:
-            timestamp = step_states[0].time
-            groups = self._groups_for_step(step_states, normalized_mode, arbitrary_angle, u_sw)
-            new_active_groups: Dict[Tuple[str, ...], Tuple[object, object, Optional[float]]] = {}
-
-            for group, latitude_span_deg in groups:
-                if group in active_groups:
-                    start_time, _, previous_span = active_groups[group]
-                    new_active_groups[group] = (
+        pair_i, pair_j, condition = self._condition_pairs(normalized_mode, arbitrary_angle, u_sw)
+        for step in range(num_steps):
+            timestamp = self.dates[step]
+            matched = np.flatnonzero(condition[:, step])
+            groups = self._groups_for_step(step, pair_i[matched], pair_j[matched])
+            new_active_groups: Dict[int, Tuple[object, object, Optional[float]]] = {}
+
+            for group_mask, latitude_span_deg in groups:
+                if group_mask in active_groups:
+                    start_time, _, previous_span = active_groups[group_mask]
+                    new_active_groups[group_mask] = (
                         start_time,
                         timestamp,
                         _max_optional(previous_span, latitude_span_deg),
                     )
                 else:
-                    new_active_groups[group] = (timestamp, timestamp, latitude_span_deg)
+                    new_active_groups[group_mask] = (timestamp, timestamp, latitude_span_deg)
 
-            for ended_group, (start_time, end_time, latitude_span_deg) in active_groups.items():
-                if ended_group not in new_active_groups:
+            for ended_mask, (start_time, end_time, latitude_span_deg) in active_groups.items():
+                if ended_mask not in new_active_groups:
                     matching_entries.append(
                         MatchEntry(
                             format_timestamp(start_time),
                             format_timestamp(end_time),
-                            list(ended_group),
+                            self._group_names(ended_mask),
                             latitude_span_deg=latitude_span_deg,
                         )
                     )
 
             active_groups = new_active_groups
 
-        for group, (start_time, end_time, latitude_span_deg) in active_groups.items():
+        for group_mask, (start_time, end_time, latitude_span_deg) in active_groups.items():
             matching_entries.append(
                 MatchEntry(
                     format_timestamp(start_time),
                     format_timestamp(end_time),
-                    list(group),
+                    self._group_names(group_mask),
                     latitude_span_deg=latitude_span_deg,
                 )
             )
 
         return matching_entries
 
+    def _group_names(self, group_mask: int) -> List[str]:
+        """Expand a body-index bitmask back into sorted body names."""
+        return sorted(name for index, name in enumerate(self._names) if group_mask >> index & 1)
+
     def _groups_for_step(
         self,
-        step_states: Sequence[BodyState],
-        mode: str,
-        arbitrary_angle: Optional[float],
-        u_sw: float,
-    ) -> List[Tuple[Tuple[str, ...], Optional[float]]]:
-        groups: Dict[Tuple[str, ...], Optional[float]] = {}
-        state_by_name = {state.name: state for state in step_states}
+        step: int,
+        first_indices: np.ndarray,
+        second_indices: np.ndarray,
+    ) -> List[Tuple[int, Optional[float]]]:
+        """Return bitmask-encoded groups and latitude spans for one time step.
+
+        Groups are the connected components of the step's matched pairs,
+        merged transitively with union-find, so a chain such as A-B plus B-C
+        becomes one A-B-C group instead of overlapping per-seed sets. Each
+        group is encoded as a single int with one bit per body index, which
+        makes the per-step persistence lookups hash one machine word instead
+        of a name tuple.
+        """
+        parent = list(range(len(self._names)))
+
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
 
-        for state1 in step_states:
-            group = {state1.name}
+        matched_bodies = set()
+        for first, second in zip(first_indices.tolist(), second_indices.tolist()):
+            matched_bodies.add(first)
+            matched_bodies.add(second)
+            root1, root2 = find(first), find(second)
+            if root1 != root2:
+                parent[root2] = root1
 
-            for state2 in step_states:
-                if state1.name == state2.name:
-                    continue
-                if self._condition_matches(state1, state2, mode, arbitrary_angle, u_sw):
-                    group.add(state2.name)
+        components: Dict[int, List[int]] = {}
+        for body_index in matched_bodies:
+            components.setdefault(find(body_index), []).append(body_index)
 
-            if len(group) > 1 and not (len(group) == 2 and "Sun" in group):
-                candidate_group = tuple(sorted(group))
-                latitude_span_deg = self._latitude_span_degrees(state_by_name, candidate_group)
-                if self._passes_latitude_filter(latitude_span_deg):
-                    groups[candidate_group] = _max_optional(groups.get(candidate_group), latitude_span_deg)
+        groups: List[Tuple[int, Optional[float]]] = []
+        sun_index = self._name_to_index.get("Sun")
 
-        return list(groups.items())
+        for component in components.values():
+            if len(component) == 2 and sun_index in component:
+                continue
 
-    def _condition_matches(
+            group_mask = 0
+            for body_index in component:
+                group_mask |= 1 << body_index
+
+            group_indices = sorted(component)
+            latitude_span_deg = self._latitude_span_degrees(step, group_indices)
+            if self._passes_latitude_filter(latitude_span_deg):
+                groups.append((group_mask, latitude_span_deg))
+
+        return groups
+
+    def _condition_pairs(
         self,
-        state1: BodyState,
-        state2: BodyState,
         mode: str,
         arbitrary_angle: Optional[float],
         u_sw: float,
-    ) -> bool:
-        lon_sep = angular_separation_rad(state1.lon_rad, state2.lon_rad)
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return upper-triangle pair indices and their (n_pairs, T) conditions.
 
-        if mode == "opposition":
-            return abs(lon_sep - math.pi) <= self.tolerance
-
-        if mode == "cone":
-            return lon_sep <= self.cone_width
-
-        if mode == "quadrature":
-            return abs(lon_sep - (math.pi / 2.0)) <= self.tolerance
+        The alignment tests are pointwise in time and symmetric in the two
+        bodies, so only the i < j pairs are evaluated, in one broadcasted
+        kernel over all steps; Python-level iteration is left to group
+        assembly only.
+        """
+        pair_i, pair_j, separation = self._pairwise_separation()
 
-        if mode == "arbitrary":
+        if mode == "opposition":
+            condition = _separation_condition(separation, math.pi, self.tolerance)
+        elif mode == "cone":
+            condition = _separation_condition(separation, 0.0, self.cone_width)
+        elif mode == "quadrature":
+            condition = _separation_condition(separation, math.pi / 2.0, self.tolerance)
+        elif mode == "arbitrary":
             target = target_separation_rad(float(arbitrary_angle))
-            return abs(lon_sep - target) <= self.tolerance
-
-        if mode == "parker":
-            return self._parker_matches(state1, state2, u_sw)
-
-        if mode == "coneparker":
-            return lon_sep <= self.cone_width and self._parker_matches(state1, state2, u_sw)
-
-        return False
+            condition = _separation_condition(separation, target, self.tolerance)
+        elif mode == "parker":
+            condition = self._parker_pairs(pair_i, pair_j, u_sw)
+        elif mode == "coneparker":
+            cone = _separation_condition(separation, 0.0, self.cone_width)
+            condition = cone & self._parker_pairs(pair_i, pair_j, u_sw, within=cone)
+        else:
+            condition = np.zeros(separation.shape, dtype=bool)
+
+        return pair_i, pair_j, condition
+
+    def _pairwise_separation(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return cached pair indices and (n_pairs, T) longitude separations.
+
+        The separation array is the same for every angular mode, so running
+        several modes against one Geometry builds it only once.
+        """
+        if self._pair_cache is None:
+            pair_i, pair_j = np.triu_indices(self.lon.shape[0], k=1)
+            separation = _circular_separation(self.lon[pair_i], self.lon[pair_j])
+            self._pair_cache = (pair_i, pair_j, separation)
+        return self._pair_cache
 
-    def _parker_matches(self, state1: BodyState, state2: BodyState, u_sw: float) -> bool:
-        phi0_1 = self.parker_spiral_function(state1.radius_km, state1.lon_rad, u_sw)
-        phi0_2 = self.parker_spiral_function(state2.radius_km, state2.lon_rad, u_sw)
-        footpoint_close = angular_separation_rad(phi0_1, phi0_2) <= self.tolerance_parker
-        latitude_close = abs(_require_latitude(state1) - _require_latitude(state2)) <= self.tolerance
-        return footpoint_close and latitude_close
+    def _parker_pairs(
+        self,
+        pair_i: np.ndarray,
+        pair_j: np.ndarray,
+        u_sw: float,
+        within: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """Return the Parker footpoint/latitude conditions per unique pair.
+
+        Source-surface footpoint longitudes are precomputed once for every
+        body and step instead of per compared pair. Pure parker mode requires
+        finite latitudes for every body up front. For coneparker, ``within``
+        carries the cone mask: latitudes only need to be finite where a pair
+        actually falls inside the cone, and pairs with missing latitudes
+        elsewhere simply evaluate False, preserving the original
+        short-circuit behavior.
+        """
+        lat_i = self.lat[pair_i]
+        lat_j = self.lat[pair_j]
+        if within is None:
+            if pair_i.size:
+                self._require_finite_latitudes()
+        else:
+            compared_without_latitude = within & ~(np.isfinite(lat_i) & np.isfinite(lat_j))
+            if compared_without_latitude.any():
+                bad_pair, bad_step = np.argwhere(compared_without_latitude)[0]
+                body_index = int(pair_i[bad_pair])
+                if np.isfinite(self.lat[body_index, bad_step]):
+                    body_index = int(pair_j[bad_pair])
+                raise ValueError(f"Latitude data are missing or nonfinite for {self._names[body_index]}.")
+
+        phi0 = self._parker_phi0_array(u_sw)
+        footpoint_separation = _circular_separation(phi0[pair_i], phi0[pair_j])
+        latitude_separation = np.abs(lat_i - lat_j)
+        return (footpoint_separation <= self.tolerance_parker) & (latitude_separation <= self.tolerance)
+
+    def _parker_phi0_array(self, u_sw: float) -> np.ndarray:
+        """Return source-surface footpoint longitudes, shape (n_bodies, n_steps).
+
+        This is the array form of :meth:`parker_spiral_function`, computed in
+        one broadcasted expression and cached per solar wind speed so that
+        repeated parker/coneparker checks reuse it.
+        """
+        speed = validate_solar_wind_speed_mps(u_sw)
+        phi0 = self._phi0_cache.get(speed)
+        if phi0 is None:
+            r_m = self.r * 1e3
+            r_ss_m = self.source_surface_radius * 1e3
+            phi0 = np.mod(self.lon + (self.solar_rotation_rate / speed) * (r_m - r_ss_m), TAU)
+            self._phi0_cache[speed] = phi0
+        return phi0
+
+    def _require_finite_latitudes(self) -> None:
+        finite = np.isfinite(self.lat).all(axis=1)
+        if not finite.all():
+            name = self._names[int(np.flatnonzero(~finite)[0])]
+            raise ValueError(f"Latitude data are missing or nonfinite for {name}.")
 
     def _latitude_span_degrees(
         self,
-        state_by_name: Mapping[str, BodyState],
-        group: Tuple[str, ...],
+        step: int,
+        group_indices: Sequence[int],
     ) -> Optional[float]:
-        latitudes = []
-        for name in group:
-            latitude = state_by_name[name].lat_rad
-            if latitude is None or not math.isfinite(latitude):
-                if self.latitude_tolerance is not None:
-                    raise ValueError(
-                        "Latitude data are missing or nonfinite for "
-                        f"{name}; cannot apply latitude_tolerance_deg."
-                    )
-                return None
-            latitudes.append(latitude)
-        if not latitudes:
+        latitudes = self.lat[list(group_indices), step]
+        finite = np.isfinite(latitudes)
+        if not finite.all():
+            if self.latitude_tolerance is not None:
+                name = self._names[group_indices[int(np.flatnonzero(~finite)[0])]]
+                raise ValueError(
+                    "Latitude data are missing or nonfinite for "
+                    f"{name}; cannot apply latitude_tolerance_deg."
+                )
             return None
-        return math.degrees(max(latitudes) - min(latitudes))
+        return math.degrees(float(latitudes.max() - latitudes.min()))
 
     def _passes_latitude_filter(self, latitude_span_deg: Optional[float]) -> bool:
         if self.latitude_tolerance is None:
@@ -322,6 +535,38 @@ class Geometry:
         return BodyState(name=name, time=timestamp, lon_rad=lon_rad, lat_rad=lat_rad, radius_km=radius_km)
 
 
+def _circular_separation(angle1_rad: np.ndarray, angle2_rad: np.ndarray) -> np.ndarray:
+    """Return the smallest circular separation between two angle arrays."""
+    return np.abs((angle1_rad - angle2_rad + math.pi) % TAU - math.pi)
+
+
+def _separation_condition(separation: np.ndarray, target_rad: float, tolerance_rad: float) -> np.ndarray:
+    """Test ``|separation - target| <= tolerance`` on plain float64 arrays.
+
+    All angular modes funnel through this one kernel, which touches only
+    NumPy arrays and scalars.
+    """
+    return np.abs(separation - target_rad) <= tolerance_rad
+
+
+def _angles_to_rad(value: object) -> np.ndarray:
+    if hasattr(value, "to_value"):
+        return np.atleast_1d(np.asarray(value.to_value("rad"), dtype=float))
+    if hasattr(value, "rad"):
+        return np.atleast_1d(np.asarray(value.rad, dtype=float))
+    return np.atleast_1d(np.asarray(value, dtype=float))
+
+
+def _distances_to_km(value: object) -> np.ndarray:
+    if hasattr(value, "to_value"):
+        return np.atleast_1d(np.asarray(value.to_value("km"), dtype=float))
+    if hasattr(value, "to"):
+        return np.atleast_1d(np.asarray(value.to("km").value, dtype=float))
+    if hasattr(value, "value"):
+        return np.atleast_1d(np.asarray(value.value, dtype=float))
+    return np.atleast_1d(np.asarray(value, dtype=float))
+
+
 def _angle_to_rad(value: object) -> float:
     if hasattr(value, "to_value"):
         return float(value.to_value("rad"))
@@ -358,9 +603,3 @@ def _max_optional(value1: Optional[float], value2: Optional[float]) -> Optional[
     if value2 is None:
         return value1
     return max(value1, value2)
-
-
-def _require_latitude(state: BodyState) -> float:
-    if state.lat_rad is None or not math.isfinite(state.lat_rad):
-        raise ValueError(f"Latitude data are missing or nonfinite for {state.name}.")
-    return state.lat_rad
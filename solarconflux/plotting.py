@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
-import math
 import re
-from collections.abc import Iterable as IterableABC
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Iterable, List, Mapping, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from .geometries import _distance_to_km, _angle_to_rad
+import numpy as np
+
+from .geometries import _angle_to_rad, _angles_to_rad, _distance_to_km, _distances_to_km
+
+_PLOTS_PER_FILE = 15
+
+# Per-process reusable figure for _render_chunk; see _chunk_figure.
+_FIGURE_CACHE: Dict[str, Tuple[object, List[object]]] = {}
 
 
 def coord_to_polar(coord: object) -> Tuple[float, float]:
@@ -27,22 +34,24 @@ def save_plot(
     trajectories: Mapping[str, Iterable[object]],
     save_base_path: object,
     formats: Sequence[str] = ("png",),
+    max_workers: Optional[int] = None,
 ) -> List[Path]:
     """Save polar plots of matched spacecraft positions.
 
     Returns the saved plot paths. ``formats`` defaults to PNG and may include
-    other Matplotlib-supported formats such as PDF.
+    other Matplotlib-supported formats such as PDF. Figures are rendered in
+    worker processes when there is more than one figure to draw;
+    ``max_workers`` caps the pool size and defaults to the executor's choice,
+    while ``max_workers=1`` renders inline without spawning any workers.
     """
     try:
-        import matplotlib.pyplot as plt
+        import matplotlib  # noqa: F401 -- fail early, before any workers start
     except ImportError as exc:
         raise ImportError("Plotting requires matplotlib.") from exc
 
     if isinstance(formats, str):
         formats = (formats,)
     formats = tuple(_normalize_format(file_format) for file_format in formats)
-    colors = ["#1f77b4", "#d62728", "#9467bd", "#17becf", "#2ca02c", "#8c564b", "#bcbd22", "#ff7f0e", "#7f7f7f", "#e377c2"]
-    plots_per_file = 15
     saved_paths: List[Path] = []
 
     all_dates = [(entry[0], entry[1]) for entries in matching_trajectories.values() for entry in entries]
@@ -53,78 +62,137 @@ def save_plot(
     main_path = Path(save_base_path) / folder
     main_path.mkdir(parents=True, exist_ok=True)
 
-    trajectory_names = list(trajectories.keys())
+    color_index = {name: index for index, name in enumerate(trajectories)}
+    body_tracks = {name: _trajectory_arrays(trajectory) for name, trajectory in trajectories.items()}
+
+    jobs = []
     for geometry, matches_iter in matching_trajectories.items():
-        matches = list(matches_iter)
+        matches = [(str(entry[0]), str(entry[1]), list(entry[2])) for entry in matches_iter]
         geometry_path = main_path / geometry
         geometry_path.mkdir(parents=True, exist_ok=True)
 
-        for chunk_start in range(0, len(matches), plots_per_file):
-            chunk = matches[chunk_start : chunk_start + plots_per_file]
-            rows = math.ceil(len(chunk) / 3)
-            fig, axes = plt.subplots(rows, 3, subplot_kw={"projection": "polar"}, figsize=(15, 5 * rows))
-            fig.suptitle(f"{_format_geometry_name(geometry)} alignment events", fontsize=14, fontweight="bold")
-            if not isinstance(axes, IterableABC):
-                axes = [axes]
-            else:
-                axes = list(getattr(axes, "flat", axes))
-
-            for idx, (start, end, group) in enumerate(chunk):
-                ax = axes[idx]
-                ax.plot(0, 0, "o", label="Sun", color="#ffb000", markersize=7, markeredgecolor="black", markeredgewidth=0.4)
-                plotted = set()
-                for body in group:
-                    coords = list(trajectories.get(body, []))
-                    if body not in trajectory_names:
-                        continue
-                    color = colors[trajectory_names.index(body) % len(colors)]
-                    event_points = [
-                        coord_to_polar(coord)
-                        for coord in coords
-                        if _coord_time_iso(coord) and start <= _coord_time_iso(coord) <= end
-                    ]
-                    if not event_points:
-                        continue
-
-                    theta, radius = zip(*event_points)
-                    label = _format_body_label(body)
-                    if len(event_points) > 1:
-                        ax.plot(theta, radius, color=color, linewidth=1.2, alpha=0.55)
-                    ax.scatter(
-                        theta,
-                        radius,
-                        color=color,
-                        s=18,
-                        marker="o",
-                        edgecolors="white",
-                        linewidths=0.5,
-                        label=label if body not in plotted else "",
-                        zorder=3,
-                    )
-                    plotted.add(body)
-
-                ax.set_title(f"Event {chunk_start + idx + 1}: {start[:10]} to {end[:10]}", fontsize=10)
-                ax.set_xlabel("Heliocentric longitude (rad)")
-                ax.set_ylabel("Radius (km)", labelpad=18)
-                ax.grid(alpha=0.25)
-                ax.legend(loc="upper right", fontsize="small", frameon=True, framealpha=0.9)
-
-            for empty_ax in axes[len(chunk) :]:
-                empty_ax.set_visible(False)
-
-            plt.tight_layout(h_pad=2, rect=(0, 0, 1, 0.95))
-            base_filename = safe_filename(
-                f"{geometry}_events_{chunk_start + 1:03d}-{chunk_start + len(chunk):03d}_"
-                f"{chunk[0][0][:10]}_to_{chunk[-1][1][:10]}"
+        for chunk_start in range(0, len(matches), _PLOTS_PER_FILE):
+            chunk = matches[chunk_start : chunk_start + _PLOTS_PER_FILE]
+            jobs.append((geometry, chunk_start, chunk, geometry_path, body_tracks, color_index, formats))
+
+    if len(jobs) <= 1 or max_workers == 1:
+        for job in jobs:
+            saved_paths.extend(_render_chunk(*job))
+    else:
+        # Figure rendering is CPU-bound and independent per chunk; the jobs
+        # carry only plain arrays and strings, so pickling them is cheap.
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_render_chunk, *job) for job in jobs]
+            for future in futures:
+                saved_paths.extend(future.result())
+    return saved_paths
+
+
+def _render_chunk(
+    geometry: str,
+    chunk_start: int,
+    chunk: Sequence[Tuple[str, str, List[str]]],
+    geometry_path: Path,
+    body_tracks: Mapping[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+    color_index: Mapping[str, int],
+    formats: Sequence[str],
+) -> List[Path]:
+    """Render and save one figure of up to ``_PLOTS_PER_FILE`` events.
+
+    Top-level so it can run in a worker process; it receives only numeric
+    arrays, strings, and paths.
+    """
+    colors = ["#1f77b4", "#d62728", "#9467bd", "#17becf", "#2ca02c", "#8c564b", "#bcbd22", "#ff7f0e", "#7f7f7f", "#e377c2"]
+    saved_paths: List[Path] = []
+
+    fig, axes = _chunk_figure()
+    fig.suptitle(f"{_format_geometry_name(geometry)} alignment events", fontsize=14, fontweight="bold")
+
+    for idx, (start, end, group) in enumerate(chunk):
+        ax = axes[idx]
+        ax.plot(0, 0, "o", label="Sun", color="#ffb000", markersize=7, markeredgecolor="black", markeredgewidth=0.4)
+        plotted = set()
+        start_time = _parse_datetime64(start)
+        end_time = _parse_datetime64(end)
+        for body in group:
+            if body not in color_index:
+                continue
+            color = colors[color_index[body] % len(colors)]
+            times, lon, radius_km = body_tracks[body]
+            mask = (times >= start_time) & (times <= end_time)
+            if not mask.any():
+                continue
+
+            theta, radius = lon[mask], radius_km[mask]
+            label = _format_body_label(body)
+            if theta.size > 1:
+                ax.plot(theta, radius, color=color, linewidth=1.2, alpha=0.55)
+            ax.scatter(
+                theta,
+                radius,
+                color=color,
+                s=18,
+                marker="o",
+                edgecolors="white",
+                linewidths=0.5,
+                label=label if body not in plotted else "",
+                zorder=3,
             )
-            for file_format in formats:
-                output_path = geometry_path / f"{base_filename}.{file_format}"
-                plt.savefig(output_path, dpi=180, bbox_inches="tight")
-                saved_paths.append(output_path)
-            plt.close(fig)
+            plotted.add(body)
+
+        ax.set_title(f"Event {chunk_start + idx + 1}: {start[:10]} to {end[:10]}", fontsize=10)
+        ax.set_xlabel("Heliocentric longitude (rad)")
+        ax.set_ylabel("Radius (km)", labelpad=18)
+        ax.grid(alpha=0.25)
+        ax.legend(loc="upper right", fontsize="small", frameon=True, framealpha=0.9)
+
+    for empty_ax in axes[len(chunk) :]:
+        empty_ax.set_visible(False)
+
+    fig.tight_layout(h_pad=2, rect=(0, 0, 1, 0.95))
+    base_filename = safe_filename(
+        f"{geometry}_events_{chunk_start + 1:03d}-{chunk_start + len(chunk):03d}_"
+        f"{chunk[0][0][:10]}_to_{chunk[-1][1][:10]}"
+    )
+    for file_format in formats:
+        output_path = geometry_path / f"{base_filename}.{file_format}"
+        fig.savefig(output_path, dpi=180, bbox_inches="tight")
+        saved_paths.append(output_path)
     return saved_paths
 
 
+def _chunk_figure() -> Tuple[object, List[object]]:
+    """Return this process's reusable 5x3 polar figure and flattened axes.
+
+    Figure and Axes construction dominate Matplotlib's per-chunk cost, so
+    one fixed grid sized for ``_PLOTS_PER_FILE`` events is allocated per
+    process and cleared between chunks; unused axes are hidden by the
+    caller and reset to visible here. The figure is built directly on an
+    Agg canvas rather than through pyplot, so it is never registered with
+    pyplot's figure manager, works headless in worker processes, and cannot
+    resurface in a caller's later ``plt.show()``.
+    """
+    cached = _FIGURE_CACHE.get("figure")
+    if cached is None:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(15, 25))
+        FigureCanvasAgg(fig)
+        axes = [
+            fig.add_subplot(5, 3, index + 1, projection="polar")
+            for index in range(_PLOTS_PER_FILE)
+        ]
+        _FIGURE_CACHE["figure"] = (fig, axes)
+        return fig, axes
+
+    fig, axes = cached
+    for ax in axes:
+        ax.clear()
+        ax.set_visible(True)
+    return fig, axes
+
+
 def safe_filename(value: object) -> str:
     """Return a compact filesystem-safe filename stem."""
     text = str(value).strip().lower()
@@ -133,6 +201,42 @@ def safe_filename(value: object) -> str:
     return text or "solarconflux_output"
 
 
+def _trajectory_arrays(trajectory: Iterable[object]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Precompute time, longitude, and radius arrays for one trajectory.
+
+    Vector coordinates such as a SkyCoord covering all time steps are
+    converted in one shot; anything else falls back to per-point conversion.
+    Times are held as ``datetime64[ns]`` so the event window test is a
+    numeric comparison; points without a usable observation time become NaT
+    and never match a window.
+    """
+    spherical = getattr(trajectory, "spherical", None)
+    obstime = getattr(trajectory, "obstime", None)
+    if spherical is not None and obstime is not None and hasattr(obstime, "datetime64"):
+        lon = _angles_to_rad(spherical.lon)
+        radius = _distances_to_km(spherical.distance)
+        times = np.atleast_1d(np.asarray(obstime.datetime64, dtype="datetime64[ns]"))
+        return times, lon, radius
+
+    points = list(trajectory)
+    times = np.asarray(
+        [_parse_datetime64(_coord_time_iso(coord)) for coord in points], dtype="datetime64[ns]"
+    )
+    if points:
+        lon_values, radius_values = zip(*(coord_to_polar(coord) for coord in points))
+    else:
+        lon_values, radius_values = (), ()
+    return times, np.asarray(lon_values, dtype=float), np.asarray(radius_values, dtype=float)
+
+
+def _parse_datetime64(value: object) -> np.datetime64:
+    """Parse an ISO-like timestamp into datetime64, returning NaT on failure."""
+    try:
+        return np.datetime64(datetime.fromisoformat(str(value).strip()))
+    except ValueError:
+        return np.datetime64("NaT")
+
+
 def _coord_time_iso(coord: object) -> str:
     time_value = getattr(coord, "time", None)
     if time_value is not None:
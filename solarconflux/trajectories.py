@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Dict, Iterable
+import hashlib
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Optional
 
 from .bodies import get_infos, validate_body_names
 from .validation import validate_date_range, validate_step
@@ -22,12 +28,19 @@ def get_trajectories(
     start_time: object,
     end_time: object,
     step: str = "60m",
+    use_cache: bool = True,
 ) -> Dict[str, object]:
     """Fetch and convert trajectories to the Heliocentric Inertial frame.
 
     This function requires SunPy, Astropy, and Astroquery at runtime. Unit tests
     can use :class:`solarconflux.geometries.TrajectoryPoint` instead of live
     Horizons queries.
+
+    Downloaded coordinates are cached on disk per ``(body, start, end, step)``
+    query under ``~/.cache/solarconflux`` (override with the
+    ``SOLARCONFLUX_CACHE_DIR`` environment variable), so repeated runs over the
+    same time range skip the Horizons round-trip. Pass ``use_cache=False`` to
+    force fresh queries.
     """
     bodies = validate_body_names(body_list)
     validate_date_range(start_time, end_time)
@@ -44,19 +57,80 @@ def get_trajectories(
     body_info = get_infos()
     trajectories: Dict[str, object] = {}
 
-    for body in bodies:
+    def fetch_one(body: str) -> object:
         body_id = body_info[body]["id"]
-        try:
-            coord = get_horizons_coord(
-                body_id,
-                {"start": start_time, "stop": end_time, "step": step},
-            )
-        except Exception as exc:
-            raise RuntimeError(f"Horizons query failed for {body!r} ({body_id!r}).") from exc
+        cache_path = _cache_path(body_id, start_time, end_time, step) if use_cache else None
+        coord = _load_cached_coord(cache_path)
+
+        if coord is None:
+            try:
+                coord = get_horizons_coord(
+                    body_id,
+                    {"start": start_time, "stop": end_time, "step": step},
+                )
+            except Exception as exc:
+                raise RuntimeError(f"Horizons query failed for {body!r} ({body_id!r}).") from exc
+            _store_cached_coord(cache_path, coord)
+
+        return coord
 
+    # The queries are network-latency bound, so overlapping them in threads
+    # cuts the total wait to roughly one round-trip.
+    if len(bodies) == 1:
+        coords = [fetch_one(bodies[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=min(8, len(bodies))) as executor:
+            coords = list(executor.map(fetch_one, bodies))
+
+    for body, coord in zip(bodies, coords):
         try:
             trajectories[body] = coord.transform_to(HeliocentricInertial())
         except Exception as exc:
             raise RuntimeError(f"Could not transform Horizons coordinates for {body!r} to HCI.") from exc
 
     return trajectories
+
+
+def _cache_directory() -> Path:
+    cache_dir = os.environ.get("SOLARCONFLUX_CACHE_DIR")
+    if cache_dir:
+        return Path(cache_dir)
+    return Path.home() / ".cache" / "solarconflux"
+
+
+def _cache_path(body_id: object, start_time: object, end_time: object, step: str) -> Path:
+    key = repr((str(body_id), str(start_time), str(end_time), str(step)))
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+    return _cache_directory() / f"horizons_{digest}.pkl"
+
+
+def _load_cached_coord(cache_path: Optional[Path]) -> object:
+    if cache_path is None or not cache_path.exists():
+        return None
+    try:
+        with cache_path.open("rb") as handle:
+            return pickle.load(handle)
+    except Exception:
+        # A stale or corrupt cache entry is not an error; refetch instead.
+        return None
+
+
+def _store_cached_coord(cache_path: Optional[Path], coord: object) -> None:
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write through a temp file and replace atomically so a concurrent
+        # or interrupted writer cannot leave a truncated entry behind.
+        descriptor, temp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as handle:
+                pickle.dump(coord, handle)
+            os.replace(temp_name, cache_path)
+        finally:
+            if os.path.exists(temp_name):
+                os.unlink(temp_name)
+    except Exception:
+        # Caching is best-effort; an unpicklable coordinate or an unwritable
+        # cache directory must not fail the query itself.
+        pass
@@ -18,6 +18,9 @@ SUPPORTED_GEOMETRIES = (
     "coneparker",
 )
 
+# Constant-time membership gate; the tuple above keeps the display order.
+_SUPPORTED_GEOMETRY_SET = frozenset(SUPPORTED_GEOMETRIES)
+
 _GEOMETRY_ALIASES = {
     "cone-parker": "coneparker",
     "cone_parker": "coneparker",
@@ -85,7 +88,7 @@ def normalize_geometry_choices(choices: Union[str, Iterable[str]]) -> List[str]:
         if not mode:
             continue
         mode = _GEOMETRY_ALIASES.get(mode, mode)
-        if mode not in SUPPORTED_GEOMETRIES:
+        if mode not in _SUPPORTED_GEOMETRY_SET:
             supported = ", ".join(SUPPORTED_GEOMETRIES)
             raise ValueError(f"Unsupported geometry mode '{choice}'. Supported modes are: {supported}.")
         if mode not in seen:
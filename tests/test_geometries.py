@@ -127,6 +127,19 @@ class GeometryTests(unittest.TestCase):
 
         self.assertEqual(matches, [])
 
+    def test_transitive_chain_merges_into_single_group(self):
+        trajectories = {
+            "Earth": [point(0, 0)],
+            "Venus": [point(0, 4)],
+            "Mars": [point(0, 8)],
+        }
+        geometry = Geometry(trajectories.keys(), trajectories, cone_width=math.radians(5))
+
+        matches = geometry.check_geometry("cone")
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].group, ["Earth", "Mars", "Venus"])
+
     def test_latitude_filter_requires_latitude_data(self):
         trajectories = {
             "Earth": [CoordinateWithoutLatitude(0, 358)],
@@ -184,6 +197,39 @@ class GeometryTests(unittest.TestCase):
 
         self.assertEqual(len(matches), 1)
 
+    def test_parker_requires_latitude_data(self):
+        trajectories = {
+            "Earth": [CoordinateWithoutLatitude(0, 359)],
+            "Venus": [CoordinateWithoutLatitude(0, 1)],
+        }
+        geometry = Geometry(trajectories.keys(), trajectories)
+
+        with self.assertRaisesRegex(ValueError, "Latitude data"):
+            geometry.check_geometry("parker", u_sw=400e3)
+
+    def test_coneparker_tolerates_missing_latitude_outside_cone(self):
+        trajectories = {
+            "Earth": [point(0, 359)],
+            "Venus": [point(0, 1)],
+            "Mars": [CoordinateWithoutLatitude(0, 180)],
+        }
+        geometry = Geometry(trajectories.keys(), trajectories, cone_width=math.radians(5))
+
+        matches = geometry.check_geometry("coneparker", u_sw=400e3)
+
+        self.assertEqual(len(matches), 1)
+        self.assertEqual(matches[0].group, ["Earth", "Venus"])
+
+    def test_coneparker_requires_latitude_data_inside_cone(self):
+        trajectories = {
+            "Earth": [point(0, 359)],
+            "Venus": [CoordinateWithoutLatitude(0, 1)],
+        }
+        geometry = Geometry(trajectories.keys(), trajectories, cone_width=math.radians(5))
+
+        with self.assertRaisesRegex(ValueError, "Latitude data"):
+            geometry.check_geometry("coneparker", u_sw=400e3)
+
     def test_coneparker_requires_cone_and_parker_conditions(self):
         trajectories = {"Earth": [point(0, 359)], "Venus": [point(0, 1)]}
         geometry = Geometry(trajectories.keys(), trajectories, cone_width=math.radians(5))
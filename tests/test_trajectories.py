@@ -0,0 +1,54 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from solarconflux.trajectories import _cache_path, _load_cached_coord, _store_cached_coord
+
+
+class TrajectoryCacheTests(unittest.TestCase):
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmpdir.cleanup)
+        patcher = mock.patch.dict(os.environ, {"SOLARCONFLUX_CACHE_DIR": self._tmpdir.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_path_is_deterministic_and_parameter_sensitive(self):
+        path = _cache_path("399", "2025-01-01", "2025-01-02", "60m")
+
+        self.assertEqual(path, _cache_path("399", "2025-01-01", "2025-01-02", "60m"))
+        self.assertEqual(path.parent, Path(self._tmpdir.name))
+        self.assertNotEqual(path, _cache_path("399", "2025-01-01", "2025-01-02", "30m"))
+        self.assertNotEqual(path, _cache_path("499", "2025-01-01", "2025-01-02", "60m"))
+
+    def test_store_and_load_round_trip(self):
+        cache_path = _cache_path("399", "2025-01-01", "2025-01-02", "60m")
+        payload = {"body": "Earth", "values": [1.0, 2.0, 3.0]}
+
+        _store_cached_coord(cache_path, payload)
+
+        self.assertEqual(_load_cached_coord(cache_path), payload)
+
+    def test_load_returns_none_without_cache_path_or_file(self):
+        self.assertIsNone(_load_cached_coord(None))
+        self.assertIsNone(_load_cached_coord(Path(self._tmpdir.name) / "missing.pkl"))
+
+    def test_load_treats_corrupt_entry_as_miss(self):
+        cache_path = Path(self._tmpdir.name) / "horizons_corrupt.pkl"
+        cache_path.write_bytes(b"not a pickle")
+
+        self.assertIsNone(_load_cached_coord(cache_path))
+
+    def test_store_swallows_unpicklable_payload(self):
+        cache_path = _cache_path("399", "2025-01-01", "2025-01-02", "60m")
+
+        _store_cached_coord(cache_path, lambda: None)
+
+        self.assertFalse(cache_path.exists())
+        self.assertEqual(list(Path(self._tmpdir.name).glob("*.tmp")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()